@@ -0,0 +1,20 @@
+"""
+Shared .gitignore matching for the push scripts.
+"""
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import pathspec
+except ImportError:
+    print("ERROR: pathspec not installed. Install with: pip install pathspec")
+    sys.exit(1)
+
+@lru_cache(maxsize=1)
+def load_spec(path=".gitignore"):
+    """Compile .gitignore into a single matcher (parsed once per process)."""
+    gitignore_path = Path(path)
+    lines = gitignore_path.read_text().splitlines() if gitignore_path.exists() else []
+    return pathspec.GitIgnoreSpec.from_lines(lines)
@@ -0,0 +1,94 @@
+# Regex extraction of invoice fields from OCR text (no Streamlit imports, so it can be tested)
+import re
+from typing import TypedDict
+
+
+class InvoiceSchema(TypedDict):
+    invoice_number: str
+    invoice_date: str
+    vendor_name: str
+    total_amount: float
+    currency: str
+    due_date: str
+    payment_terms: str
+    items_count: int
+    tax_amount: float
+
+# The OCR result replaces Gemini only when all of these are found
+OCR_REQUIRED_FIELDS = ('invoice_number', 'invoice_date', 'vendor_name', 'total_amount')
+
+_DATE = r'(\d{1,4}[/.\-]\d{1,2}[/.\-]\d{1,4}|[A-Za-z]{3,9}\.? \d{1,2},? \d{4}|\d{1,2} [A-Za-z]{3,9}\.? \d{4})'
+_CURRENCY = r'(?:[$€£₹]|USD|EUR|GBP|INR)?'
+# 1,234.56 / 1.234,56 / 1234.56 / 1234; the lookahead stops '123' matching inside '123456789'
+_AMOUNT = r'(\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?(?!\d)|\d+(?:[.,]\d{1,2})?(?!\d))'
+# Label, optional '(...)' note, then the value on the same line
+_VALUE = r'(?:[ \t]*\([^)\n]*\))?[ \t]*:?[ \t]*'
+# Totals followed by a unit are counts ('Total: 3 items'), not amounts
+_NOT_COUNT = r'(?![ \t]*(?:items?|qty|pcs)\b)'
+
+# Alternatives per field, most specific label first; the first tier with a match wins
+INVOICE_FIELD_PATTERNS = {
+    'invoice_number': [
+        # The label must end at a word boundary and the value must contain a digit
+        re.compile(r'\binvoice[ \t]*(?:(?:no|number|num)(?!\w)\.?|#)[ \t]*[:#]?[ \t]*(?=[A-Z0-9\-/]*\d)([A-Z0-9][A-Z0-9\-/]*)', re.I),
+    ],
+    'invoice_date': [
+        re.compile(r'\b(?:invoice[ \t]+date|date[ \t]+of[ \t]+issue|issue[ \t]+date|date[ \t]+issued)' + _VALUE + _DATE, re.I),
+        re.compile(r'(?<!due )(?<!order )(?<!delivery )(?<!ship )(?<!shipping )(?<!payment )\bdate' + _VALUE + _DATE, re.I),
+    ],
+    'due_date': [
+        re.compile(r'\b(?:due[ \t]+date|payment[ \t]+due|date[ \t]+due)' + _VALUE + _DATE, re.I),
+    ],
+    'vendor_name': [
+        re.compile(r'^[ \t]*(?:vendor|supplier|seller|sold[ \t]+by|issued[ \t]+by|bill(?:ed)?[ \t]+from)[ \t]*:[ \t]*(\S[^\n]*?)[ \t]*$', re.I | re.M),
+    ],
+    'total_amount': [
+        re.compile(r'\bgrand[ \t]+total' + _VALUE + _CURRENCY + r'[ \t]*' + _AMOUNT + _NOT_COUNT, re.I),
+        re.compile(r'\b(?:invoice[ \t]+total|total[ \t]+amount|total[ \t]+due|total[ \t]+payable)' + _VALUE + _CURRENCY + r'[ \t]*' + _AMOUNT + _NOT_COUNT, re.I),
+        re.compile(r'(?<!tax )(?<!vat )(?<!gst )(?<!line )(?<!sub )\btotal\b' + _VALUE + _CURRENCY + r'[ \t]*' + _AMOUNT + _NOT_COUNT, re.I),
+    ],
+    'tax_amount': [
+        re.compile(r'\b(?:tax|vat|gst)(?:[ \t]+amount)?(?:[ \t]*\(?[ \t]*\d+(?:[.,]\d+)?[ \t]*%[ \t]*\)?)?[ \t]*:?[ \t]*' + _CURRENCY + r'[ \t]*' + _AMOUNT, re.I),
+    ],
+    'items_count': [
+        re.compile(r'\b(?:number[ \t]+of[ \t]+items|no\.?[ \t]+of[ \t]+items|item[ \t]+count|total[ \t]+items)[ \t]*:?[ \t]*(\d+)\b', re.I),
+    ],
+    'payment_terms': [
+        re.compile(r'\b(net[ \t]*\d+|due[ \t]+on[ \t]+receipt)\b', re.I),
+    ],
+}
+DATE_PATTERN = re.compile(_DATE)
+CURRENCY_CODES = re.compile(r'\b(USD|EUR|GBP|INR)\b')
+CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP', '₹': 'INR'}
+
+def parse_amount(text):
+    # A trailing separator with 1-2 digits is the decimal point; any other separator groups thousands
+    last_sep = max(text.rfind(','), text.rfind('.'))
+    if last_sep != -1 and len(text) - last_sep - 1 in (1, 2):
+        whole, fraction = text[:last_sep], text[last_sep + 1:]
+    else:
+        whole, fraction = text, '0'
+    return float(re.sub(r'[.,]', '', whole) + '.' + fraction)
+
+def parse_invoice_text(text):
+    data = dict.fromkeys(InvoiceSchema.__annotations__)
+    for field, patterns in INVOICE_FIELD_PATTERNS.items():
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                data[field] = match.group(1)
+                break
+    # A labelled line holding a date (e.g. a billing period) is not a vendor
+    if data['vendor_name'] is not None and (data['vendor_name'][0].isdigit() or DATE_PATTERN.search(data['vendor_name'])):
+        data['vendor_name'] = None
+    for field in ('total_amount', 'tax_amount'):
+        if data[field] is not None:
+            data[field] = parse_amount(data[field])
+    if data['items_count'] is not None:
+        data['items_count'] = int(data['items_count'])
+    code = CURRENCY_CODES.search(text)
+    data['currency'] = code.group(1) if code else next((code for symbol, code in CURRENCY_SYMBOLS.items() if symbol in text), None)
+    return data
+
+def has_required_fields(data):
+    return all(data[field] is not None for field in OCR_REQUIRED_FIELDS)
@@ -0,0 +1,133 @@
+"""
+Shared helpers for push.py: file collection, blob hashing/encoding and
+rate-limit-aware GitHub API calls.
+"""
+
+import os
+import sys
+import time
+import mmap
+import hashlib
+import functools
+import base64
+from pathlib import Path, PurePosixPath
+
+try:
+    from github import GithubException
+except ImportError:
+    print("ERROR: PyGithub not installed. Install with: pip install PyGithub")
+    sys.exit(1)
+
+from _ignore import load_spec
+
+# Parallel blob uploads (kept low for GitHub's secondary rate limits)
+MAX_WORKERS = 8
+
+# Larger files are skipped rather than uploaded
+MAX_FILE_SIZE = 50 * 1024 * 1024
+
+# Retries for rate-limited calls, and the quota floor checked before uploading
+MAX_RETRIES = 6
+RATE_LIMIT_FLOOR = 50
+
+def get_repo_url():
+    """Extract owner/repo from HTTPS URL."""
+    url = "https://github.com/oswin26/Invoice-AI-.git"
+    # Parse: https://github.com/oswin26/Invoice-AI-.git
+    parts = url.replace("https://github.com/", "").replace(".git", "").split("/")
+    if len(parts) != 2:
+        print(f"ERROR: Invalid URL format: {url}")
+        sys.exit(1)
+    return parts[0], parts[1]
+
+def gh_call(fn):
+    """Retry a GitHub API call when rate limited, honouring the response headers."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_RETRIES):
+            try:
+                return fn(*args, **kwargs)
+            except GithubException as e:
+                headers = e.headers or {}
+                rate_limited = e.status == 429 or (
+                    e.status == 403
+                    and ("retry-after" in headers or headers.get("x-ratelimit-remaining") == "0")
+                )
+                if not rate_limited or attempt == MAX_RETRIES - 1:
+                    raise
+                if "retry-after" in headers:
+                    delay = int(headers["retry-after"])
+                elif "x-ratelimit-reset" in headers:
+                    delay = max(int(headers["x-ratelimit-reset"]) - time.time(), 0) + 1
+                else:
+                    delay = 2 ** attempt
+                print(f"  ⏳ Rate limited, retrying in {delay:.0f}s")
+                time.sleep(delay)
+    return wrapper
+
+def wait_for_rate_limit(g):
+    """Sleep until reset if the remaining core quota is below RATE_LIMIT_FLOOR."""
+    remaining, _ = g.rate_limiting
+    if remaining < RATE_LIMIT_FLOOR:
+        delay = max(g.rate_limiting_resettime - time.time(), 0) + 1
+        print(f"⏳ Only {remaining} API calls left, waiting {delay:.0f}s for reset")
+        time.sleep(delay)
+
+def iter_files(base, ignore_spec):
+    """Yield DirEntry objects for files under base, pruning ignored directories."""
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Skip hidden dirs and venv
+                if entry.name.startswith(".") or entry.name in ["venv", "__pycache__"]:
+                    continue
+                if ignore_spec.match_file(entry.path + "/"):
+                    continue
+                yield from iter_files(entry.path, ignore_spec)
+            elif entry.is_file() and not ignore_spec.match_file(entry.path):
+                yield entry
+
+def collect_files():
+    """Collect all files to commit (respecting .gitignore)."""
+    ignore_spec = load_spec()
+    files = {}
+    
+    for entry in iter_files(".", ignore_spec):
+        # Check size only; contents are read at upload time
+        try:
+            size = entry.stat().st_size
+            if size > MAX_FILE_SIZE:
+                print(f"  ! Skipped {entry.path}: {size} bytes exceeds {MAX_FILE_SIZE}")
+                continue
+            # Use forward slashes for GitHub
+            filepath = Path(entry.path)
+            github_path = PurePosixPath(*filepath.relative_to(".").parts).as_posix()
+            files[github_path] = filepath
+            print(f"  + {github_path}")
+        except Exception as e:
+            print(f"  ! Skipped {entry.path}: {e}")
+    
+    return files
+
+def encode_file(filepath):
+    """Base64-encode a file straight from a read-only memory map."""
+    if filepath.stat().st_size == 0:
+        return ""
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return base64.b64encode(mm).decode("ascii")
+
+def git_blob_sha(filepath):
+    """Compute the git blob SHA-1 of a file, as GitHub would for its content."""
+    size = filepath.stat().st_size
+    digest = hashlib.sha1(b"blob %d\0" % size)
+    if size:
+        with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest.update(mm)
+    return digest.hexdigest()
+
+def create_blob(repo, filepath, existing_sha=None):
+    """Upload a file as a base64 blob, unless existing_sha already has its content."""
+    sha = git_blob_sha(filepath)
+    if sha == existing_sha:
+        return sha
+    return gh_call(repo.create_git_blob)(encode_file(filepath), "base64").sha
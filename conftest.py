@@ -0,0 +1,2 @@
+# Intentionally empty: a rootdir conftest.py makes pytest (rootdir/prepend import mode) insert the repo root
+# into sys.path, so tests can import top-level modules such as _invoice_ocr without installing the app
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Minimal GitHub repo pusher using PyGithub.
+Reads all files in current directory (respecting .gitignore),
+creates/pushes to a GitHub repo via the Git Data API in a single commit.
+Works for empty repos: the first file is committed with the Contents API
+so the Git Data API has a branch to build on.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _push_common import (
+    MAX_WORKERS,
+    collect_files,
+    create_blob,
+    get_repo_url,
+    gh_call,
+    wait_for_rate_limit,
+)
+from github import Github, GithubException, InputGitTreeElement
+
+def main():
+    """Initialize and push repo to GitHub."""
+    
+    # Get credentials
+    token = os.getenv("GITHUB_TOKEN")
+    if not token:
+        print("ERROR: GITHUB_TOKEN env var not set.")
+        print("Set it with: $env:GITHUB_TOKEN='your_token_here'")
+        print("Get a token at: https://github.com/settings/tokens/new")
+        sys.exit(1)
+    
+    owner, repo_name = get_repo_url()
+    print(f"\n📦 Pushing to: https://github.com/{owner}/{repo_name}")
+    
+    # Connect to GitHub
+    try:
+        g = Github(token)
+        user = g.get_user()
+        print(f"✅ Authenticated as: {user.login}")
+    except GithubException as e:
+        print(f"ERROR: Authentication failed: {e}")
+        sys.exit(1)
+    
+    # Get repo, creating it with auto_init (so 'main' exists) if it is missing
+    try:
+        repo = user.get_repo(repo_name)
+        print(f"✅ Found repo: {repo.full_name}")
+    except GithubException as e:
+        if e.status != 404 or user.login != owner:
+            print(f"ERROR: Repo {owner}/{repo_name} not found or not accessible.")
+            print(f"Make sure the repo exists and your token has 'repo' scope.")
+            sys.exit(1)
+        try:
+            repo = user.create_repo(repo_name, auto_init=True, private=False)
+            print(f"✅ Created repo: {repo.full_name}")
+        except GithubException as e:
+            print(f"ERROR: Could not create repo {owner}/{repo_name}: {e}")
+            sys.exit(1)
+    
+    # Collect files
+    print("\n📂 Collecting files...")
+    files = collect_files()
+    
+    if not files:
+        print("ERROR: No files to commit.")
+        sys.exit(1)
+    
+    print(f"✅ Found {len(files)} file(s) to commit")
+    
+    # Resolve the target branch once (main, else master, else the default branch)
+    try:
+        refs = {ref.ref: ref for ref in repo.get_git_matching_refs("heads/")}
+    except GithubException:
+        # Empty repos have no refs yet
+        refs = {}
+    branch_ref = (
+        refs.get("refs/heads/main")
+        or refs.get("refs/heads/master")
+        or refs.get(f"refs/heads/{repo.default_branch}")
+    )
+    if not refs:
+        # Repos created without auto_init have no commits, which the Git Data API
+        # rejects; one Contents API write creates 'main' to build on
+        first_path, first_file = min(files.items())
+        gh_call(repo.create_file)(first_path, "Initial commit", first_file.read_bytes(), branch="main")
+        branch_ref = repo.get_git_ref("heads/main")
+        print(f"✅ Repo was empty, created 'main' with {first_path}")
+    branch_name = branch_ref.ref.split("/")[-1]
+    base_commit = repo.get_git_commit(branch_ref.object.sha)
+    base_tree = base_commit.tree
+    print(f"✅ Using existing '{branch_name}' branch")
+    
+    # Blob SHAs already on the branch; files with matching content are not re-uploaded
+    existing = {
+        element.path: element.sha
+        for element in repo.get_git_tree(base_tree.sha, recursive=True).tree
+        if element.type == "blob"
+    }
+    
+    # Create tree elements
+    print("\n🔄 Creating Git tree...")
+    wait_for_rate_limit(g)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            filepath: executor.submit(create_blob, repo, local_path, existing.get(filepath))
+            for filepath, local_path in sorted(files.items())
+        }
+        tree_elements = []
+        for filepath, future in futures.items():
+            sha = future.result()
+            if sha == existing.get(filepath):
+                print(f"  = {filepath} (unchanged)")
+                continue
+            tree_elements.append(InputGitTreeElement(
+                path=filepath,
+                mode="100644",
+                type="blob",
+                sha=sha
+            ))
+            print(f"  ✅ {filepath}")
+    
+    if not tree_elements:
+        print(f"\n✅ Everything up to date, nothing to push.")
+        return
+    
+    # Create tree
+    tree = gh_call(repo.create_git_tree)(tree_elements, base_tree=base_tree)
+    print(f"✅ Tree created: {tree.sha[:7]}")
+    
+    # Create commit
+    commit_msg = "🚀 Deploy Invoice AI to Streamlit Cloud\n\n- Added vision.py (Streamlit app)\n- Added Dockerfile for containerization\n- Added GitHub Actions CI workflow\n- Added Streamlit config and deployment files"
+    
+    commit = gh_call(repo.create_git_commit)(
+        message=commit_msg,
+        tree=tree,
+        parents=[base_commit]
+    )
+    print(f"✅ Commit created: {commit.sha[:7]}")
+    
+    # Update ref
+    gh_call(branch_ref.edit)(commit.sha)
+    print(f"✅ Updated {branch_name} branch to latest commit")
+    
+    print(f"\n✅ SUCCESS! Repo pushed.")
+    print(f"📍 Repository: https://github.com/{owner}/{repo_name}")
+    print(f"\nNext steps:")
+    print(f"1. Go to https://streamlit.io/cloud")
+    print(f"2. Click 'New app'")
+    print(f"3. Select repo: {owner}/{repo_name}, branch: main, file: vision.py")
+    print(f"4. Add secret: GOOGLE_API_KEY = <your_api_key>")
+    print(f"5. Click 'Deploy'")
+
+if __name__ == "__main__":
+    main()
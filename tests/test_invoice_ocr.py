@@ -0,0 +1,124 @@
+import pytest
+
+from _invoice_ocr import has_required_fields, parse_amount, parse_invoice_text
+
+
+INVOICE = '''ACME Corp
+Vendor: ACME Corp
+Invoice No: INV-2024/001
+Order date 01/01/2024
+Invoice Date: 02/01/2024
+Due Date: 03/01/2024
+Customer VAT ID: GB123456789
+Terms: Net 30
+Subtotal $1,000.00
+Tax (10%) $100.00
+Total $1,100.00
+Paid: 250.00
+Balance Due: 850.00
+'''
+
+
+def test_parses_labelled_fields():
+    data = parse_invoice_text(INVOICE)
+    assert data['invoice_number'] == 'INV-2024/001'
+    assert data['invoice_date'] == '02/01/2024'
+    assert data['due_date'] == '03/01/2024'
+    assert data['vendor_name'] == 'ACME Corp'
+    assert data['total_amount'] == 1100.0
+    assert data['tax_amount'] == 100.0
+    assert data['payment_terms'] == 'Net 30'
+    assert data['currency'] == 'USD'
+    assert has_required_fields(data)
+
+
+def test_balance_due_is_not_the_total():
+    data = parse_invoice_text('Paid: 250.00\nBalance Due: 0.00\n')
+    assert data['total_amount'] is None
+
+
+def test_grand_total_outranks_other_totals():
+    data = parse_invoice_text('Total items: 3\nTotal 90.00\nGrand Total: 99.00\n')
+    assert data['total_amount'] == 99.0
+    assert data['items_count'] == 3
+
+
+def test_vat_id_is_not_a_tax_amount():
+    data = parse_invoice_text('Customer VAT ID: GB123456789\nVAT No: 123456789\n')
+    assert data['tax_amount'] is None
+
+
+def test_tax_amount_must_be_on_the_same_line():
+    data = parse_invoice_text('Tax\n42.00\n')
+    assert data['tax_amount'] is None
+
+
+def test_invoice_date_outranks_other_dates():
+    data = parse_invoice_text('Order date 01/01/2024\nInvoice Date: 02/01/2024\n')
+    assert data['invoice_date'] == '02/01/2024'
+
+
+def test_other_dates_are_not_the_invoice_date():
+    data = parse_invoice_text('Order date 01/01/2024\nDue date: 02/01/2024\n')
+    assert data['invoice_date'] is None
+
+
+def test_european_amount_format():
+    data = parse_invoice_text('Total 1.234,56 EUR\n')
+    assert data['total_amount'] == 1234.56
+    assert data['currency'] == 'EUR'
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1,234.56', 1234.56),
+    ('1.234,56', 1234.56),
+    ('1.234', 1234.0),
+    ('1234.5', 1234.5),
+    ('250', 250.0),
+])
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == expected
+
+
+def test_missing_vendor_falls_back_to_gemini():
+    data = parse_invoice_text('Invoice #: 77\nDate: 2024-04-01\nTotal: 50.00\n')
+    assert data['vendor_name'] is None
+    assert not has_required_fields(data)
+
+
+@pytest.mark.parametrize('text', [
+    'Invoice Notes: thanks\n',
+    'Invoice number is below\n',
+    'Invoice Nothing: 123\n',
+])
+def test_invoice_number_needs_a_real_label_and_a_digit(text):
+    assert parse_invoice_text(text)['invoice_number'] is None
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Invoice #77\n', '77'),
+    ('Invoice No. A-12\n', 'A-12'),
+    ('Invoice Number: INV2024\n', 'INV2024'),
+])
+def test_invoice_number_labels(text, expected):
+    assert parse_invoice_text(text)['invoice_number'] == expected
+
+
+def test_tax_and_sub_totals_are_not_the_total():
+    data = parse_invoice_text('Subtotal 1000.00\nSub Total 1000.00\nTax Total: 100.00\nVAT total 100.00\nTotal: 1100.00\n')
+    assert data['total_amount'] == 1100.0
+
+
+def test_item_count_total_is_not_an_amount():
+    data = parse_invoice_text('Total: 3 items\nTotal: 45.00\n')
+    assert data['total_amount'] == 45.0
+
+
+def test_billing_period_is_not_a_vendor():
+    data = parse_invoice_text('From: 01/01/2024 To: 31/01/2024\n')
+    assert data['vendor_name'] is None
+
+
+def test_billing_period_after_vendor_label_is_rejected():
+    data = parse_invoice_text('Bill From: Jan 01, 2024 - Jan 31, 2024\n')
+    assert data['vendor_name'] is None
@@ -4,13 +4,50 @@ load_dotenv()
 
 import streamlit as st
 import os
+import io
 import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 from datetime import datetime
+import pypdfium2 as pdfium
 import google.generativeai as genai
+from google.api_core.exceptions import ResourceExhausted
+from _invoice_ocr import InvoiceSchema, has_required_fields, parse_invoice_text
 
-os.getenv('GOOGLE_API_KEY')
-genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+# Concurrent invoice extractions and retries when Gemini returns 429
+EXTRACTION_WORKERS = 8
+GEMINI_MAX_RETRIES = 5
+
+# PDFs are sent to Gemini as JPEG renders of their first pages
+PDF_MAX_PAGES = 3
+PDF_RENDER_DPI = 150
+
+# PDFium is not thread-safe; extraction workers and user sessions share this lock
+PDFIUM_LOCK = threading.Lock()
+
+# Longest edge of the cached upload previews (Compare grid / single Q&A view);
+# shown at natural size, never stretched to the column width
+THUMBNAIL_SIZE = 256
+PREVIEW_SIZE = 1024
+
+# Analysis data over this many characters (~25k tokens) is summarized in groups before answering
+ANALYSIS_CHAR_BUDGET = 100_000
+ANALYSIS_BATCH_SIZE = 50
+SUMMARY_WORKERS = 4
+
+# Structured output: Gemini returns JSON matching InvoiceSchema directly
+EXTRACTION_CONFIG = {'response_mime_type': 'application/json', 'response_schema': InvoiceSchema}
+
+# Part of the persisted extraction cache key; bump when the OCR patterns, prompt or schema change
+EXTRACTION_VERSION = 3
 
 st.set_page_config(
     page_title='InvoiceAI Pro',
@@ -32,32 +69,115 @@ h2 { color: #1a1a1a; font-weight: 800; margin-top: 30px; }
 
 st.markdown(custom_css, unsafe_allow_html=True)
 
-def get_gemini_response(input_prompt, image, user_question):
-    model = genai.GenerativeModel('gemini-2.0-flash')
-    response = model.generate_content([input_prompt, image[0], user_question])
-    return response.text
+@st.cache_resource
+def get_model():
+    genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+    return genai.GenerativeModel('gemini-2.0-flash')
+
+def get_gemini_response(input_prompt, image, user_question, generation_config=None):
+    model = get_model()
+    for attempt in range(GEMINI_MAX_RETRIES):
+        try:
+            response = model.generate_content([input_prompt, *image, user_question], generation_config=generation_config)
+            return response.text
+        except ResourceExhausted:
+            if attempt == GEMINI_MAX_RETRIES - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+@st.cache_resource
+def ocr_available():
+    if pytesseract is None:
+        return False
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except pytesseract.TesseractNotFoundError:
+        return False
+
+def extract_local(image_data):
+    if not ocr_available() or not all(part['mime_type'].startswith('image') for part in image_data):
+        return None
+    text = '\n'.join(pytesseract.image_to_string(Image.open(io.BytesIO(part['data']))) for part in image_data)
+    data = parse_invoice_text(text)
+    if has_required_fields(data):
+        return data
+    return None
+
+@st.cache_data(show_spinner=False, persist='disk')
+def _extract_cached(version, content_hash, _image_data):
+    # Keyed on version and content_hash only; raising keeps failed responses out of the cache
+    data = extract_local(_image_data)
+    if data is not None:
+        return data
+    response_text = get_gemini_response('Extract the invoice details.', _image_data, 'Extract invoice details', EXTRACTION_CONFIG)
+    return json.loads(response_text)
 
 def extract_invoice_data(image_data, invoice_name):
-    extraction_prompt = 'Extract invoice info as JSON with: invoice_number, invoice_date, vendor_name, total_amount, currency, due_date, payment_terms, items_count, tax_amount'
+    content_hash = hashlib.sha256()
+    for part in image_data:
+        content_hash.update(part['data'])
     try:
-        response_text = get_gemini_response(extraction_prompt, image_data, 'Extract invoice details')
-        json_start = response_text.find('{')
-        json_end = response_text.rfind('}') + 1
-        if json_start >= 0 and json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            data = json.loads(json_str)
-            data['"'"'invoice_name'"'"'] = invoice_name
-            return data
-        return {'error': 'Could not parse', 'invoice_name': invoice_name}
+        data = _extract_cached(EXTRACTION_VERSION, content_hash.hexdigest(), image_data)
+        data['invoice_name'] = invoice_name
+        return data
     except Exception as e:
         return {'error': str(e), 'invoice_name': invoice_name}
 
+@st.cache_data(show_spinner=False)
+def make_thumbnail(image_bytes, max_size=THUMBNAIL_SIZE):
+    img = Image.open(io.BytesIO(image_bytes))
+    # Lets libjpeg decode at a reduced scale instead of full resolution
+    img.draft('RGB', (max_size, max_size))
+    img.thumbnail((max_size, max_size))
+    buffer = io.BytesIO()
+    img.convert('RGB').save(buffer, 'JPEG', quality=75)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False)
+def render_pdf_pages(pdf_bytes):
+    pages = []
+    # Every PDFium call, including freeing pages and bitmaps, stays under the lock
+    with PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        try:
+            for index in range(min(len(pdf), PDF_MAX_PAGES)):
+                page = pdf[index]
+                bitmap = page.render(scale=PDF_RENDER_DPI / 72)
+                buffer = io.BytesIO()
+                bitmap.to_pil().save(buffer, 'JPEG', quality=80)
+                bitmap.close()
+                page.close()
+                pages.append({'mime_type': 'image/jpeg', 'data': buffer.getvalue()})
+        finally:
+            pdf.close()
+    return pages
+
 def input_image_setup(uploaded_file):
     if uploaded_file is not None:
         bytes_data = uploaded_file.getvalue()
+        if uploaded_file.type == 'application/pdf':
+            return render_pdf_pages(bytes_data)
         return [{'mime_type': uploaded_file.type, 'data': bytes_data}]
     raise FileNotFoundError('No file uploaded')
 
+def process_invoice(uploaded_file):
+    return extract_invoice_data(input_image_setup(uploaded_file), uploaded_file.name)
+
+def summarize_invoice_group(batch):
+    summary_prompt = 'Summarize these invoices into a compact structured digest. Keep each invoice name, number, vendor, dates, currency, tax and total amount.'
+    return get_gemini_response(summary_prompt, [{'mime_type': 'text/plain', 'data': json.dumps(batch).encode()}], '')
+
+def analyze_invoices(all_data, question):
+    data = json.dumps(all_data, indent=2)
+    if len(data) > ANALYSIS_CHAR_BUDGET:
+        # Map: digest groups in parallel; reduce: answer over the digests
+        batches = [all_data[i:i + ANALYSIS_BATCH_SIZE] for i in range(0, len(all_data), ANALYSIS_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
+            data = '\n\n'.join(executor.map(summarize_invoice_group, batches))
+    prompt = f'Analyze these invoices and answer: {question}\n\nData:\n{data}'
+    return get_gemini_response('You are an invoice analysis expert.', [{'mime_type': 'text/plain', 'data': prompt.encode()}], '')
+
 st.markdown('<div style=\"text-align: center; padding: 30px;\"><h1 style=\"color: #3b82f6; font-size: 48px;\"> InvoiceAI Pro</h1><p style=\"color: #666;\">Enterprise Invoice Processing</p></div>', unsafe_allow_html=True)
 
 tab1, tab2, tab3 = st.tabs([' Compare', ' Q&A', ' Analytics'])
@@ -75,8 +195,7 @@ with tab1:
             with preview_cols[idx % 3]:
                 try:
                     if file.type.startswith('image'):
-                        img = Image.open(file)
-                        st.image(img, caption=file.name[:20], use_column_width=True)
+                        st.image(make_thumbnail(file.getvalue()), caption=file.name[:20])
                     else:
                         st.info(f'📄 {file.name}')
                 except Exception as e:
@@ -99,16 +218,19 @@ with tab1:
                 progress_bar = st.progress(0)
                 status_placeholder = st.empty()
                 
-                all_data = []
-                for idx, file in enumerate(uploaded_files):
-                    status_placeholder.info(f'📄 Processing {idx+1}/{len(uploaded_files)}: {file.name}')
-                    try:
-                        img_data = input_image_setup(file)
-                        extracted = extract_invoice_data(img_data, file.name)
-                        all_data.append(extracted)
-                    except Exception as e:
-                        st.error(f'Error processing {file.name}: {str(e)}')
-                    progress_bar.progress((idx + 1) / len(uploaded_files))
+                results = {}
+                status_placeholder.info(f'📄 Processing {len(uploaded_files)} invoice(s)...')
+                with ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS) as executor:
+                    futures = {executor.submit(process_invoice, file): idx for idx, file in enumerate(uploaded_files)}
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        file = uploaded_files[futures[future]]
+                        status_placeholder.info(f'📄 Processed {done}/{len(uploaded_files)}: {file.name}')
+                        try:
+                            results[futures[future]] = future.result()
+                        except Exception as e:
+                            st.error(f'Error processing {file.name}: {str(e)}')
+                        progress_bar.progress(done / len(uploaded_files))
+                all_data = [results[idx] for idx in sorted(results)]
                 
                 status_placeholder.empty()
                 progress_bar.empty()
@@ -119,8 +241,7 @@ with tab1:
                     
                     st.subheader('🤖 AI Analysis')
                     try:
-                        prompt = f'Analyze these invoices and answer: {question}\n\nData:\n{json.dumps(all_data, indent=2)}'
-                        response = get_gemini_response('You are an invoice analysis expert.', [{'mime_type': 'text/plain', 'data': prompt.encode()}], '')
+                        response = analyze_invoices(all_data, question)
                         st.info(response)
                     except Exception as e:
                         st.error(f'Analysis failed: {str(e)}')
@@ -132,8 +253,7 @@ with tab2:
     if single_file:
         try:
             if single_file.type.startswith('image'):
-                img = Image.open(single_file)
-                st.image(img, caption=single_file.name, use_column_width=True)
+                st.image(make_thumbnail(single_file.getvalue(), PREVIEW_SIZE), caption=single_file.name)
             else:
                 st.info(f'📄 {single_file.name}')
         except Exception as e: